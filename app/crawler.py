@@ -159,6 +159,15 @@ class TikTokCrawler:
                 if not field_data or field_data in ['', 'None', 'null', 'N/A', '-']:
                     return None
                 
+                # Canonical YYYY-MM-DD is already the output form: validate it with
+                # the C ISO parser and skip the strptime/strftime round-trip
+                if len(field_data) == 10 and field_data[4] == '-' and field_data[7] == '-':
+                    try:
+                        date.fromisoformat(field_data)
+                        return field_data
+                    except ValueError:
+                        pass
+                
                 # Try parsing as date
                 for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d']:
                     try:
@@ -882,6 +891,14 @@ class TikTokCrawler:
             logger.error(f"❌ Pending retry failed: {e}")
             return {'success': False, 'message': str(e), 'stats': {}}
 
+    def shutdown(self):
+        """Release Playwright resources kept alive between calls"""
+        if self.playwright_crawler:
+            try:
+                self.playwright_crawler.shutdown()
+            except Exception as e:
+                logger.warning(f"⚠️ Playwright shutdown error: {e}")
+
     # Legacy method for single video (kept for compatibility)
     def get_tiktok_views(self, video_url: str) -> Optional[Dict]:
         """Get TikTok video stats using Playwright"""
@@ -2,6 +2,13 @@ import requests
 import time
 import logging
 
+# orjson serializes the batch write payloads faster (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class LarkClient:
@@ -199,6 +206,16 @@ class LarkClient:
         is_write = method.upper() in ('POST', 'PUT', 'PATCH', 'DELETE')
         get_token = self._get_write_token if is_write else self._get_tenant_token
 
+        # Serialize a JSON body once with orjson; token retries resend the same bytes
+        if ORJSON_AVAILABLE and kwargs.get('json') is not None:
+            try:
+                kwargs['data'] = orjson.dumps(kwargs['json'])
+                del kwargs['json']
+                kwargs['headers'] = {**kwargs.get('headers', {}),
+                                     'Content-Type': 'application/json; charset=utf-8'}
+            except TypeError:
+                pass  # not orjson-serializable: let requests encode it
+
         max_retries = 2
         for attempt in range(max_retries):
             token = get_token()
@@ -5,6 +5,7 @@ load_dotenv()
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+import gc
 import logging
 from datetime import datetime
 import json
@@ -158,16 +159,21 @@ async def startup_event():
     logger.info("🚀 Application starting up...")
     init_clients()
     _start_scheduler()
+    # Modules, clients and config live for the whole process: move them out of
+    # the GC's reach so the crawler's periodic collections skip them
+    gc.freeze()
     logger.info("✅ Application ready")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Gracefully shut down scheduler."""
+    """Gracefully shut down scheduler and the shared Playwright browser."""
     global scheduler
     if scheduler and scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("⏰ Scheduler stopped")
+    if crawler:
+        crawler.shutdown()
 
 @app.get("/")
 async def root():
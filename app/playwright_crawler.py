@@ -16,15 +16,19 @@ Previous fixes:
 """
 
 import asyncio
+import atexit
 import json
 import random
 import gc
+import functools
+import itertools
 import time
 import re
 import logging
-import concurrent.futures
+import os
+import threading
 import traceback
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
@@ -39,9 +43,63 @@ try:
 except ImportError:
     STEALTH_AVAILABLE = False
 
+# orjson parses the large embedded JSON blobs several times faster (optional)
+try:
+    import orjson
+    json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# httpx: plain-HTTP fast path that skips the browser when the page is server-rendered (optional)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# pysimdjson: on-demand lookups, only the subtree we read is materialized (optional)
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def disable_playwright_stack_capture() -> bool:
+    """
+    Stop playwright-python from calling inspect.stack() on every API call.
+    The captured frames only feed tracing/error metadata but the walk costs
+    a large share of CPU on evaluate-heavy pages. Opt-in: PW_INSPECT_STACK=0.
+    """
+    if os.getenv('PW_INSPECT_STACK', '1') != '0':
+        return False
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return False
+
+    real_inspect = _connection.inspect
+
+    class _NoStackInspect:
+        @staticmethod
+        def stack(*args, **kwargs):
+            return []
+
+        def __getattr__(self, name):
+            return getattr(real_inspect, name)
+
+    _connection.inspect = _NoStackInspect()
+    logger.info("⚡ Playwright stack capture disabled (PW_INSPECT_STACK=0)")
+    return True
+
+
+STACK_CAPTURE_DISABLED = disable_playwright_stack_capture()
+
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -52,25 +110,42 @@ class CrawlerConfig:
     delay_range: Tuple[float, float] = (0.5, 1.5)      # Shorter delays (was 2-4s)
     timeout_ms: int = 20000                             # 20s timeout (was 30s)
     max_retries: int = 1                                # 1 retry max (was 3)
-    restart_browser_every: int = 50                     # Restart after N videos (was 75)
+    restart_browser_every: int = 50                     # Rotate a worker's context after N videos (browser stays up)
+    max_rss_mb: int = 1500                              # Recycle contexts, then the browser, above this memory usage
+    min_videos_between_restarts: int = 20               # Videos between memory-pressure rotations/restarts
     browser_close_timeout: int = 10                     # Close timeout (was 15)
-    wait_after_load: float = 1.5                        # Wait for JS render (was 2.5s)
+    data_wait_ms: int = 8000                            # Wait for a data <script> after commit (replaces 1.5s sleep)
+    extract_timeout_ms: int = 6000                      # Total budget for all extraction methods on one page
     retry_failed_at_end: bool = False                   # Disabled — saves 2nd full pass
     use_firefox_fallback: bool = False                  # Disabled — saves RAM
     max_end_retries: int = 1                            # Max end retries
+    concurrency: int = 3                                # Parallel workers in crawl_all (one context each)
+    http_fast_path: bool = True                         # Try a plain HTTP fetch before the browser
+    http_timeout: float = 10.0                          # Fast-path request timeout (seconds)
+    http_max_misses: int = 5                            # Consecutive fast-path misses before it is skipped for the batch
 
     # Crash loop protection
     max_consecutive_crashes: int = 5                    # Max crashes before skip
     crash_restart_delay: float = 2.0                    # Delay between crash restarts (was 3s)
     memory_cleanup_interval: int = 20                   # GC every N videos (was 25)
+    gc_threshold_mb: int = 300                          # Skip GC passes while this process's own RSS is below this
 
     # Publish date priority
     preserve_existing_publish_date: bool = True         # Keep existing dates
     clear_data_on_broken_link: bool = True              # Empty values for broken links
 
 
+@dataclass(slots=True)
+class CrawlStats:
+    """Per-run counters, attribute access instead of dict lookups in the hot loop"""
+    total: int = 0
+    success: int = 0
+    failed: int = 0
+    start_time: float = 0.0
+
+
 # Extended User Agents pool
-USER_AGENTS = [
+USER_AGENTS = (
     # Chrome on Windows
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -84,13 +159,37 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:122.0) Gecko/20100101 Firefox/122.0',
     # Edge
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0',
-]
+)
+
+# Round-robin rotation: even coverage across the pool, no RNG call per restart
+_UA_CYCLE = itertools.cycle(USER_AGENTS)
+
+# Fixed new_context() options, built once. Service workers are blocked so every
+# request goes through the context route (SW fetches bypass it) and none get registered.
+_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1280, 'height': 720},  # smaller viewport saves RAM
+    'locale': 'en-US',
+    'timezone_id': 'Asia/Ho_Chi_Minh',
+    'java_script_enabled': True,
+    'bypass_csp': True,
+    'ignore_https_errors': True,
+    'has_touch': False,
+    'is_mobile': False,
+    'device_scale_factor': 1,
+    'color_scheme': 'light',
+    'service_workers': 'block',
+}
 
 
 # ============================================================================
 # URL VALIDATION
 # ============================================================================
 
+# Canonical video URL - the common case, accepted without urlparse
+_FAST_TIKTOK = re.compile(r'^https?://(?:www\.|m\.)?tiktok\.com/@[\w.-]+/video/(\d+)')
+_VIDEO_ID_RE = re.compile(r'/video/(\d+)')
+
+
 def validate_tiktok_url(url: str) -> Tuple[bool, str]:
     """
     Validate TikTok URL before crawling
@@ -101,6 +200,9 @@ def validate_tiktok_url(url: str) -> Tuple[bool, str]:
     
     url = str(url).strip()
     
+    if _FAST_TIKTOK.match(url):
+        return True, url
+    
     # Check for obviously invalid URLs
     if len(url) < 10:
         return False, f"URL too short: {url}"
@@ -125,7 +227,7 @@ def validate_tiktok_url(url: str) -> Tuple[bool, str]:
         # Check for video path (should have /video/ or be a short link)
         if '/video/' in url:
             # Full URL - validate video ID
-            match = re.search(r'/video/(\d+)', url)
+            match = _VIDEO_ID_RE.search(url)
             if not match:
                 return False, f"Cannot extract video ID from: {url}"
         elif 'vt.tiktok' in url or 'vm.tiktok' in url:
@@ -150,21 +252,121 @@ def convert_timestamp_to_date(timestamp) -> Optional[str]:
         if not timestamp:
             return None
         
-        ts = int(timestamp) if isinstance(timestamp, str) else timestamp
+        ts = int(timestamp)
         
         # Handle milliseconds
         if ts > 9999999999:
-            ts = ts / 1000
-        
-        dt = datetime.fromtimestamp(ts)
+            ts //= 1000
         
-        # Validate reasonable date range
-        if dt.year < 2016 or dt.year > 2030:
-            return None
-            
-        return dt.strftime('%Y-%m-%d')
-    except:
+        return _ts_to_date(ts)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+@functools.lru_cache(maxsize=8192)
+def _ts_to_date(ts: int) -> Optional[str]:
+    """Cached second-resolution conversion; re-crawls hit the same timestamps"""
+    dt = datetime.fromtimestamp(ts)
+    
+    # Validate reasonable date range
+    if dt.year < 2016 or dt.year > 2030:
         return None
+    
+    return dt.strftime('%Y-%m-%d')
+
+
+_PAGE_MB = os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+# (usage file, stat file, reclaimable page-cache key) for cgroup v2 and v1
+_CGROUP_MEMORY_FILES = (
+    ('/sys/fs/cgroup/memory.current', '/sys/fs/cgroup/memory.stat', 'inactive_file'),
+    ('/sys/fs/cgroup/memory/memory.usage_in_bytes', '/sys/fs/cgroup/memory/memory.stat', 'total_inactive_file'),
+)
+
+
+def _process_tree_rss_mb(root_pid: int) -> Optional[float]:
+    """Current RSS of a process and all its descendants (driver + Chromium), from /proc"""
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return None
+    children: Dict[int, List[int]] = {}
+    pages: Dict[int, int] = {}
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces: ppid is the 2nd field after ')'
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            with open(f'/proc/{entry}/statm') as f:
+                resident = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        pid = int(entry)
+        children.setdefault(ppid, []).append(pid)
+        pages[pid] = resident
+    if root_pid not in pages:
+        return None
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += pages.get(pid, 0)
+        stack.extend(children.get(pid, ()))
+    return total * _PAGE_MB
+
+
+def _cgroup_working_set_mb() -> Optional[float]:
+    """Container usage minus reclaimable page cache, or None outside a cgroup"""
+    for usage_path, stat_path, inactive_key in _CGROUP_MEMORY_FILES:
+        try:
+            with open(usage_path) as f:
+                usage = int(f.read().strip())
+            inactive = 0
+            with open(stat_path) as f:
+                for line in f:
+                    key, _, value = line.partition(' ')
+                    if key == inactive_key:
+                        inactive = int(value)
+                        break
+            return max(usage - inactive, 0) / (1024 * 1024)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def get_memory_usage_mb() -> float:
+    """
+    Current memory used by this process and its children (Playwright driver + Chromium), in MB.
+    Unlike the cgroup counter or peak RSS it excludes page cache and drops
+    as soon as a context or the browser is closed. Falls back to the
+    cgroup working set where /proc can't be walked.
+    """
+    rss = _process_tree_rss_mb(os.getpid())
+    if rss is not None:
+        return rss
+    return _cgroup_working_set_mb() or 0.0
+
+
+def _self_rss_mb() -> Optional[float]:
+    """This process's current RSS (the Python heap, not Chromium), from /proc/self/statm"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_MB
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def collect_garbage(threshold_mb: float, generation: int = 2) -> bool:
+    """
+    Run gc.collect(generation) only when this process's own RSS is over threshold_mb
+    (always, if RSS can't be read).
+    """
+    rss = _self_rss_mb()
+    if rss is not None and rss < threshold_mb:
+        return False
+    gc.collect(generation)
+    return True
 
 
 def is_valid_publish_date(date_str: Optional[str]) -> bool:
@@ -178,7 +380,13 @@ def is_valid_publish_date(date_str: Optional[str]) -> bool:
     if not date_str or date_str in ['', 'None', 'null', 'N/A', '-']:
         return False
     
-    # Validate date format YYYY-MM-DD
+    # Validate date format YYYY-MM-DD (fast path for the zero-padded form)
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            date.fromisoformat(date_str)
+            return True
+        except ValueError:
+            pass
     try:
         datetime.strptime(date_str, '%Y-%m-%d')
         return True
@@ -186,12 +394,74 @@ def is_valid_publish_date(date_str: Optional[str]) -> bool:
         return False
 
 
+def retry_backoff(attempt: int) -> float:
+    """Exponential backoff with a little jitter: ~0.5s, 1s, 2s ... capped at 8s"""
+    return min(8.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.25)
+
+
+def short_error_message(e: Exception, limit: int = 100) -> str:
+    """
+    First line of an exception message, truncated.
+    Reads the message argument directly instead of str(e), which for Playwright
+    errors formats the whole call log only for it to be sliced away.
+    """
+    message = e.args[0] if e.args and isinstance(e.args[0], str) else type(e).__name__
+    return message.split('\n', 1)[0][:limit]
+
+
+# Prebuilt failure result, copied per video instead of rebuilding the full dict literal
+_FAILED_RESULT_TEMPLATE = {
+    'url': '',
+    'success': False,
+    'views': None,
+    'likes': None,
+    'comments': None,
+    'shares': None,
+    'publish_date': None,
+    'error': '',
+    'is_broken': False,
+    'pending_propagation': False,
+}
+
+
+def build_failed_result(url: str, error: str, publish_date: Optional[str] = None,
+                        is_broken: bool = False, pending_propagation: bool = False) -> Dict:
+    """Build a failed crawl result from the prebuilt template"""
+    result = _FAILED_RESULT_TEMPLATE.copy()
+    result['url'] = url
+    result['error'] = error
+    result['publish_date'] = publish_date
+    result['is_broken'] = is_broken
+    result['pending_propagation'] = pending_propagation
+    return result
+
+
+def build_video_data(views: int, likes=0, comments=0, shares=0, create_time=None, channel_id='') -> Dict:
+    """Common result shape for every extraction method"""
+    return {
+        'views': views,
+        'likes': likes or 0,
+        'comments': comments or 0,
+        'shares': shares or 0,
+        'publish_date': convert_timestamp_to_date(create_time) if create_time else None,
+        'channel_id': channel_id or '',
+    }
+
+
+async def safe_close(closable, timeout: float = 2.0):
+    """Close a page or context, giving up after `timeout` so a hung target can't stall a worker"""
+    try:
+        await asyncio.wait_for(closable.close(), timeout)
+    except Exception:
+        pass
+
+
 # ============================================================================
 # ENHANCED STEALTH SCRIPT
 # ============================================================================
 
-STEALTH_SCRIPT = """
-() => {
+_RAW_STEALTH_SCRIPT = """
+(() => {
     // Hide webdriver
     Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
     
@@ -238,14 +508,249 @@ STEALTH_SCRIPT = """
         window.mouseMovements.push({x: e.clientX, y: e.clientY, t: Date.now()});
         if (window.mouseMovements.length > 100) window.mouseMovements.shift();
     });
-}
+})();
 """
 
+# add_init_script evaluates its source as-is, so the body is an IIFE: a bare
+# arrow function would just be defined and never called.
+# Minified once at import: comments and indentation stripped, so each
+# add_init_script ships a single short line over the Playwright pipe.
+STEALTH_SCRIPT = re.sub(r'\s*//[^\n]*|\s*\n\s*', ' ', _RAW_STEALTH_SCRIPT).strip()
+
+
+# ============================================================================
+# RESOURCE BLOCKING
+# ============================================================================
+
+_BLOCKED_RESOURCE_TYPES = frozenset((
+    "image", "media", "font", "stylesheet",
+    # Server-sent updates and subtitle/PWA fetches never feed the embedded JSON
+    # (WebSockets are not routed through context.route in Playwright 1.40)
+    "eventsource", "texttrack", "manifest",
+))
+# Generic trackers plus TikTok's own telemetry/metrics hosts (mon*/mcs* on tiktokv.com)
+_BLOCKED_URL_RE = re.compile(
+    r'analytics|tracker|beacon|sentry|monitoring|//(?:mon|mcs)(?:-[a-z]+)?\.tiktokv\.com/'
+)
+
+
+async def block_unneeded_resources(route):
+    """
+    Block heavy resources we don't need (images, media, fonts, CSS, event streams).
+    TikTok video data lives in JSON <script> tags — nothing visual needed.
+    This alone cuts page-load time ~40% and RAM usage significantly.
+    """
+    request = route.request
+    resource_type = request.resource_type
+    if resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    # Never URL-filter the page itself: a handle like @sentry_clips would match
+    elif resource_type != 'document' and _BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 # ============================================================================
 # DATA EXTRACTION - MULTIPLE METHODS
 # ============================================================================
 
+# One cached parser per thread: batches and single-video crawls run their
+# event loops on different threads, and a simdjson parser is not shareable
+_simd_local = threading.local()
+
+
+def _get_simd_parser():
+    parser = getattr(_simd_local, 'parser', None)
+    if parser is None:
+        parser = _simd_local.parser = simdjson.Parser()
+    return parser
+
+
+def _as_bytes(raw_json) -> bytes:
+    return raw_json.encode() if isinstance(raw_json, str) else raw_json
+
+
+def _simd_to_python(node):
+    """
+    Detach a simdjson value from its parser. A live Object/Array proxy that
+    outlives the call blocks every later parse on this thread's parser.
+    """
+    if isinstance(node, simdjson.Object):
+        return node.as_dict()
+    if isinstance(node, simdjson.Array):
+        return node.as_list()
+    return node
+
+
+def load_json_at(raw_json, *path: str):
+    """
+    Return the value at path inside a JSON document, or None if it is missing.
+    With simdjson only that subtree is converted to Python objects.
+    """
+    if SIMDJSON_AVAILABLE:
+        try:
+            node = _get_simd_parser().parse(_as_bytes(raw_json)).at_pointer('/' + '/'.join(path))
+        except (KeyError, IndexError, TypeError):
+            return None
+        return _simd_to_python(node)
+
+    node = json_loads(raw_json)
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+# The only leaves Methods 1 and 3 read from an itemStruct
+_ITEM_FIELDS = (
+    'stats/playCount', 'stats/diggCount', 'stats/commentCount', 'stats/shareCount',
+    'createTime', 'author/uniqueId',
+)
+_UNIVERSAL_ITEM_PATH = ('__DEFAULT_SCOPE__', 'webapp.video-detail', 'itemInfo', 'itemStruct')
+_NEXT_ITEM_PATH = ('props', 'pageProps', 'itemInfo', 'itemStruct')
+
+
+def load_json_fields(raw_json, base: Tuple[str, ...], fields: Tuple[str, ...]) -> Optional[Dict]:
+    """
+    Look up several leaves under base with a single parse.
+    Returns {field: value or None}, or None if base itself is missing.
+    With simdjson each leaf is a pointer jump; siblings are never materialized.
+    """
+    if SIMDJSON_AVAILABLE:
+        try:
+            node = _get_simd_parser().parse(_as_bytes(raw_json)).at_pointer('/' + '/'.join(base))
+        except (KeyError, IndexError, TypeError):
+            return None
+        if not isinstance(node, simdjson.Object):
+            return None
+        result = {}
+        for name in fields:
+            try:
+                result[name] = _simd_to_python(node.at_pointer('/' + name))
+            except (KeyError, IndexError, TypeError):
+                result[name] = None
+        return result
+
+    node = load_json_at(raw_json, *base)
+    if not isinstance(node, dict):
+        return None
+    result = {}
+    for name in fields:
+        value = node
+        for key in name.split('/'):
+            value = value.get(key) if isinstance(value, dict) else None
+        result[name] = value
+    return result
+
+
+# Any of the embedded data containers; the first one attached ends the wait
+_DATA_SCRIPT_SELECTOR = 'script#__UNIVERSAL_DATA_FOR_REHYDRATION__, script#SIGI_STATE, script#__NEXT_DATA__'
+
+_UNIVERSAL_SCRIPT_MARKER = b'id="__UNIVERSAL_DATA_FOR_REHYDRATION__"'
+
+
+def slice_universal_blob(body: bytes) -> Optional[bytes]:
+    """
+    Cut the UNIVERSAL_DATA script contents out of raw server HTML (HTTP fast path).
+    Three bounded finds on the undecoded body - no regex, no str decode of the page.
+    """
+    marker = body.find(_UNIVERSAL_SCRIPT_MARKER)
+    if marker < 0:
+        return None
+    start = body.find(b'>', marker) + 1
+    end = body.find(b'</script>', start)
+    if start <= 0 or end < 0:
+        return None
+    return body[start:end]
+
+
+# Methods 1-3 and 5 read from this single evaluate instead of one round-trip each
+_PROBE_SCRIPT = '''() => {
+    const text = (id) => {
+        const el = document.getElementById(id);
+        return el ? el.textContent : null;
+    };
+    const selectors = [
+        '[data-e2e="video-views"]',
+        '[data-e2e="browse-video-count"]',
+        'strong[data-e2e="video-views"]',
+        '.video-count',
+        '.tiktok-1xiuanb-StrongVideoCount'
+    ];
+    let dom = null;
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        if (el && el.textContent) { dom = el.textContent.trim(); break; }
+    }
+    return {
+        universal: text('__UNIVERSAL_DATA_FOR_REHYDRATION__'),
+        sigi: text('SIGI_STATE'),
+        next: text('__NEXT_DATA__'),
+        dom: dom,
+        title: document.title || '',
+    };
+}'''
+
+# Method 4 runs its regexes inside the page and returns only the captured
+# values, instead of shipping the whole serialized DOM over the wire.
+# First hit per key wins, playCount included: a later non-zero count usually
+# belongs to another item on the page. The alternate view keys are only tried
+# when playCount is missing or zero. The scan stops once all five keys are in.
+_HTML_STATS_SCRIPT = r'''() => {
+    const html = document.documentElement.outerHTML;
+    const out = {};
+    if (html.includes('Count"') || html.includes('"createTime"')) {
+        const re = /"(playCount|diggCount|commentCount|shareCount|createTime)"\s*:\s*"?(\d+)"?/g;
+        let m;
+        while ((m = re.exec(html)) !== null) {
+            // Skip the account's createTime: "author" opened within 500 chars and not yet closed
+            if (m[1] === 'createTime') {
+                const before = html.slice(Math.max(0, m.index - 500), m.index);
+                const author = before.lastIndexOf('"author"');
+                if (author !== -1 && before.indexOf('}', author) === -1) continue;
+            }
+            if (!(m[1] in out)) {
+                out[m[1]] = m[2];
+                if (Object.keys(out).length === 5) break;
+            }
+        }
+    }
+    if (!out.playCount || out.playCount === '0') {
+        const alternates = [
+            ['"play_count"', /"play_count"\s*:\s*(\d+)/],
+            ['"viewCount"', /"viewCount"\s*:\s*(\d+)/],
+            ['playCount&quot;', /playCount&quot;:(\d+)/],
+        ];
+        for (const [marker, re] of alternates) {
+            if (!html.includes(marker)) continue;
+            const m = re.exec(html);
+            if (m) {
+                out.altViews = m[1];
+                if (Number(m[1]) > 0) break;
+            }
+        }
+    }
+    if (html.includes('"uniqueId"')) {
+        const m = /"uniqueId"\s*:\s*"([^"]+)"/.exec(html);
+        if (m) out.uniqueId = m[1];
+    }
+    return out;
+}'''
+
+# Error-page markers in document.title
+_CAPTCHA_TITLE_RE = re.compile(r'captcha|verify', re.I)
+_MISSING_TITLE_RE = re.compile(r'not found|unavailable', re.I)
+
+# Final-error markers in crawl_single ('no data extracted' is deliberately not broken)
+_BROKEN_ERROR_RE = re.compile(r'not found|unavailable|removed|404', re.I)
+_PENDING_ERROR_RE = re.compile(r'pending_propagation', re.I)
+
+_VIEW_RE = re.compile(r'(\d*\.?\d+)\s*([KMB])?', re.I)
+_VIEW_MULTIPLIERS = {'': 1, 'K': 1000, 'M': 1000000, 'B': 1000000000}
+
+
 async def check_page_data_status(page: Page) -> str:
     """
     Quick check (< 0.3s) whether TikTok has data available on this page.
@@ -313,202 +818,147 @@ async def check_page_data_status(page: Page) -> str:
         return 'unknown'
 
 
+# ===== METHOD 1: UNIVERSAL_DATA (Primary - Most Reliable) =====
+async def _extract_universal(page: Page, probe: Dict) -> Optional[Dict]:
+    raw_json = probe.get('universal')
+    if not raw_json:
+        return None
+    item = load_json_fields(raw_json, _UNIVERSAL_ITEM_PATH, _ITEM_FIELDS)
+    if not item:
+        return None
+    views = item['stats/playCount']
+    if not views or views <= 0:
+        return None
+    return build_video_data(
+        views, item['stats/diggCount'], item['stats/commentCount'], item['stats/shareCount'],
+        item['createTime'], item['author/uniqueId'],
+    )
+
+
+# ===== METHOD 2: SIGI_STATE (Legacy Format) =====
+async def _extract_sigi(page: Page, probe: Dict) -> Optional[Dict]:
+    raw_json = probe.get('sigi')
+    if not raw_json:
+        return None
+    item_module = load_json_at(raw_json, 'ItemModule') or {}
+    for video_data in item_module.values():
+        stats = video_data.get('stats', {})
+        views = stats.get('playCount', 0)
+        if views and views > 0:
+            # In SIGI_STATE, 'author' is usually the uniqueId string directly
+            raw_author = video_data.get('author', '')
+            channel_id = raw_author if isinstance(raw_author, str) else raw_author.get('uniqueId', '')
+            return build_video_data(
+                views, stats.get('diggCount'), stats.get('commentCount'), stats.get('shareCount'),
+                video_data.get('createTime'), channel_id,
+            )
+    return None
+
+
+# ===== METHOD 3: NEXT_DATA (New React Format) =====
+async def _extract_next(page: Page, probe: Dict) -> Optional[Dict]:
+    raw_json = probe.get('next')
+    if not raw_json:
+        return None
+    item_info = load_json_fields(raw_json, _NEXT_ITEM_PATH, _ITEM_FIELDS)
+    if not item_info:
+        return None
+    views = item_info['stats/playCount']
+    if not views or views <= 0:
+        return None
+    return build_video_data(
+        views, item_info['stats/diggCount'], item_info['stats/commentCount'],
+        item_info['stats/shareCount'], item_info['createTime'], item_info['author/uniqueId'],
+    )
+
+
+# ===== METHOD 4: Regex from HTML (Last Resort) =====
+async def _extract_html_regex(page: Page, probe: Dict) -> Optional[Dict]:
+    found = await page.evaluate(_HTML_STATS_SCRIPT) or {}
+    views = int(found.get('playCount') or 0) or int(found.get('altViews') or 0)
+    if views <= 0:
+        return None
+    return build_video_data(
+        views, int(found.get('diggCount') or 0), int(found.get('commentCount') or 0),
+        int(found.get('shareCount') or 0), found.get('createTime'), found.get('uniqueId'),
+    )
+
+
+# ===== METHOD 5: DOM Scraping (Visual Elements) =====
+async def _extract_dom(page: Page, probe: Dict) -> Optional[Dict]:
+    # Views from the visible counter, collected by the probe
+    views_text = probe.get('dom')
+    if not views_text:
+        return None
+    views = parse_view_count(views_text)
+    return build_video_data(views) if views > 0 else None
+
+
+# (name, extractor, needs another page round-trip) in priority order.
+# The probe-backed methods are free once the probe is in; the error-page
+# title check runs just before the first one that has to go back to the page.
+_EXTRACTORS = (
+    ('UNIVERSAL_DATA', _extract_universal, False),
+    ('SIGI_STATE', _extract_sigi, False),
+    ('NEXT_DATA', _extract_next, False),
+    ('REGEX', _extract_html_regex, True),
+    ('DOM', _extract_dom, False),
+)
+
+
+async def extract_from_html(body: bytes) -> Optional[Dict]:
+    """
+    Stats straight from raw server HTML via its UNIVERSAL_DATA blob.
+    Shared by the HTTP fast path and the browser's own document response.
+    """
+    blob = slice_universal_blob(body)
+    if not blob:
+        return None
+    return await _extract_universal(None, {'universal': blob})
+
+
 async def extract_video_data(page: Page, url: str) -> Optional[Dict]:
     """
     Extract video data using multiple methods with comprehensive fallbacks
     """
-    data = None
-    extraction_method = None
-    
     try:
-        # ===== METHOD 1: UNIVERSAL_DATA (Primary - Most Reliable) =====
+        # One round-trip for all embedded JSON blobs and the DOM view counter
         try:
-            raw_json = await page.evaluate('''() => {
-                const script = document.querySelector('#__UNIVERSAL_DATA_FOR_REHYDRATION__');
-                return script ? script.textContent : null;
-            }''')
-            
-            if raw_json:
-                json_data = json.loads(raw_json)
-                scope = json_data.get('__DEFAULT_SCOPE__', {})
-                video_detail = scope.get('webapp.video-detail', {})
-                item = video_detail.get('itemInfo', {}).get('itemStruct', {})
-                
-                if item:
-                    stats = item.get('stats', {})
-                    views = stats.get('playCount', 0)
-                    if views and views > 0:
-                        author = item.get('author', {})
-                        data = {
-                            'views': views,
-                            'likes': stats.get('diggCount', 0),
-                            'comments': stats.get('commentCount', 0),
-                            'shares': stats.get('shareCount', 0),
-                            'publish_date': convert_timestamp_to_date(item.get('createTime')),
-                            'channel_id': author.get('uniqueId', '') if isinstance(author, dict) else str(author),
-                        }
-                        extraction_method = 'UNIVERSAL_DATA'
+            probe = await page.evaluate(_PROBE_SCRIPT) or {}
         except Exception as e:
-            logger.debug(f"Method 1 (UNIVERSAL_DATA) failed: {e}")
-        
-        # ===== METHOD 2: SIGI_STATE (Legacy Format) =====
-        if not data:
-            try:
-                raw_json = await page.evaluate('''() => {
-                    const script = document.querySelector('#SIGI_STATE');
-                    return script ? script.textContent : null;
-                }''')
-                
-                if raw_json:
-                    json_data = json.loads(raw_json)
-                    item_module = json_data.get('ItemModule', {})
-                    
-                    for video_id, video_data in item_module.items():
-                        stats = video_data.get('stats', {})
-                        views = stats.get('playCount', 0)
-                        if views and views > 0:
-                            # In SIGI_STATE, 'author' is usually the uniqueId string directly
-                            raw_author = video_data.get('author', '')
-                            channel_id = raw_author if isinstance(raw_author, str) else raw_author.get('uniqueId', '')
-                            data = {
-                                'views': views,
-                                'likes': stats.get('diggCount', 0),
-                                'comments': stats.get('commentCount', 0),
-                                'shares': stats.get('shareCount', 0),
-                                'publish_date': convert_timestamp_to_date(video_data.get('createTime')),
-                                'channel_id': channel_id,
-                            }
-                            extraction_method = 'SIGI_STATE'
-                            break
-            except Exception as e:
-                logger.debug(f"Method 2 (SIGI_STATE) failed: {e}")
-        
-        # ===== METHOD 3: NEXT_DATA (New React Format) =====
-        if not data:
-            try:
-                raw_json = await page.evaluate('''() => {
-                    const script = document.querySelector('#__NEXT_DATA__');
-                    return script ? script.textContent : null;
-                }''')
-                
-                if raw_json:
-                    json_data = json.loads(raw_json)
-                    props = json_data.get('props', {}).get('pageProps', {})
-                    item_info = props.get('itemInfo', {}).get('itemStruct', {})
-                    
-                    if item_info:
-                        stats = item_info.get('stats', {})
-                        views = stats.get('playCount', 0)
-                        if views and views > 0:
-                            author = item_info.get('author', {})
-                            data = {
-                                'views': views,
-                                'likes': stats.get('diggCount', 0),
-                                'comments': stats.get('commentCount', 0),
-                                'shares': stats.get('shareCount', 0),
-                                'publish_date': convert_timestamp_to_date(item_info.get('createTime')),
-                                'channel_id': author.get('uniqueId', '') if isinstance(author, dict) else str(author),
-                            }
-                            extraction_method = 'NEXT_DATA'
-            except Exception as e:
-                logger.debug(f"Method 3 (NEXT_DATA) failed: {e}")
+            logger.debug("Page probe failed: %s", e)
+            probe = {}
         
-        # ===== METHOD 4: Regex from HTML (Last Resort) =====
-        if not data:
+        title_checked = False
+        for number, (name, extractor, needs_page) in enumerate(_EXTRACTORS, 1):
+            if needs_page and not title_checked:
+                # Known error pages carry no stats: stop before going back to the page
+                title_checked = True
+                title = probe.get('title') or ''
+                if _CAPTCHA_TITLE_RE.search(title):
+                    logger.warning(f"🚫 CAPTCHA detected for: {url}")
+                    return None
+                if _MISSING_TITLE_RE.search(title):
+                    logger.warning(f"⚠️ Video not found/unavailable: {url}")
+                    return None
+            
             try:
-                html = await page.content()
-                
-                # Try multiple patterns for playCount
-                patterns = [
-                    r'"playCount"\s*:\s*(\d+)',
-                    r'"play_count"\s*:\s*(\d+)', 
-                    r'"viewCount"\s*:\s*(\d+)',
-                    r'playCount&quot;:(\d+)',
-                    r'"stats"\s*:\s*\{[^}]*"playCount"\s*:\s*(\d+)',
-                ]
-                
-                views = None
-                for pattern in patterns:
-                    match = re.search(pattern, html)
-                    if match:
-                        views = int(match.group(1))
-                        if views > 0:
-                            break
-                
-                if views and views > 0:
-                    # Try to get createTime
-                    time_match = re.search(r'"createTime"\s*:\s*"?(\d{10,13})"?', html)
-                    publish_date = convert_timestamp_to_date(time_match.group(1)) if time_match else None
-
-                    # Try to get other stats
-                    likes_match = re.search(r'"diggCount"\s*:\s*(\d+)', html)
-                    comments_match = re.search(r'"commentCount"\s*:\s*(\d+)', html)
-                    shares_match = re.search(r'"shareCount"\s*:\s*(\d+)', html)
-                    # Try to get channel username
-                    username_match = re.search(r'"uniqueId"\s*:\s*"([^"]+)"', html)
-
-                    data = {
-                        'views': views,
-                        'likes': int(likes_match.group(1)) if likes_match else 0,
-                        'comments': int(comments_match.group(1)) if comments_match else 0,
-                        'shares': int(shares_match.group(1)) if shares_match else 0,
-                        'publish_date': publish_date,
-                        'channel_id': username_match.group(1) if username_match else '',
-                    }
-                    extraction_method = 'REGEX'
+                data = await extractor(page, probe)
             except Exception as e:
-                logger.debug(f"Method 4 (REGEX) failed: {e}")
-        
-        # ===== METHOD 5: DOM Scraping (Visual Elements) =====
-        if not data:
-            try:
-                # Try to get views from visible element
-                views_text = await page.evaluate('''() => {
-                    const selectors = [
-                        '[data-e2e="video-views"]',
-                        '[data-e2e="browse-video-count"]',
-                        'strong[data-e2e="video-views"]',
-                        '.video-count',
-                        '.tiktok-1xiuanb-StrongVideoCount'
-                    ];
-                    for (const sel of selectors) {
-                        const el = document.querySelector(sel);
-                        if (el && el.textContent) return el.textContent.trim();
-                    }
-                    return null;
-                }''')
-                
-                if views_text:
-                    views = parse_view_count(views_text)
-                    if views and views > 0:
-                        data = {
-                            'views': views,
-                            'likes': 0,
-                            'comments': 0,
-                            'shares': 0,
-                            'publish_date': None,
-                        }
-                        extraction_method = 'DOM'
-            except Exception as e:
-                logger.debug(f"Method 5 (DOM) failed: {e}")
-        
-        # Log extraction result
-        if data:
-            logger.debug(f"✅ Extracted via {extraction_method}: {data['views']:,} views, date: {data.get('publish_date', 'N/A')}")
-        else:
-            # Check for known error pages
-            title = await page.title()
-            if 'captcha' in title.lower() or 'verify' in title.lower():
-                logger.warning(f"🚫 CAPTCHA detected for: {url}")
-            elif 'not found' in title.lower() or 'unavailable' in title.lower():
-                logger.warning(f"⚠️ Video not found/unavailable: {url}")
-            else:
-                logger.debug(f"❌ All extraction methods failed for: {url}")
+                logger.debug("Method %d (%s) failed: %s", number, name, e)
+                continue
+            
+            if data:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("✅ Extracted via %s: %s views, date: %s",
+                                 name, f"{data['views']:,}", data.get('publish_date', 'N/A'))
+                return data
         
-        return data
+        logger.debug("❌ All extraction methods failed for: %s", url)
+        return None
         
     except Exception as e:
-        logger.debug(f"Extraction error: {e}")
+        logger.debug("Extraction error: %s", e)
         return None
 
 
@@ -517,25 +967,18 @@ def parse_view_count(text: str) -> int:
     if not text:
         return 0
     
-    text = str(text).strip().upper().replace(',', '')
+    text = str(text).replace(',', '')
+    # Plain digit strings ('1234') need no regex or float round-trip
+    if text.isascii() and text.isdigit():
+        return int(text)
     
-    try:
-        # Remove non-numeric except K, M, B, .
-        text = re.sub(r'[^\d.KMB]', '', text)
-        
-        if not text:
-            return 0
-        
-        multipliers = {'K': 1000, 'M': 1000000, 'B': 1000000000}
-        
-        for suffix, multiplier in multipliers.items():
-            if suffix in text:
-                number = float(text.replace(suffix, ''))
-                return int(number * multiplier)
-        
-        return int(float(text))
-    except:
+    # Single pass: number plus optional K/M/B suffix.
+    # The regex only matches valid floats and known suffixes, so no try/except.
+    match = _VIEW_RE.search(text)
+    if not match:
         return 0
+    # round(), not int(): 1.005 * 1000 is 1004.999... in binary floating point
+    return round(float(match.group(1)) * _VIEW_MULTIPLIERS[(match.group(2) or '').upper()])
 
 
 # ============================================================================
@@ -552,8 +995,12 @@ class SequentialTikTokCrawler:
         self.browser = None
         self.playwright = None
         self.context = None
+        self.contexts: List[BrowserContext] = []  # One per worker; contexts[0] is self.context
         self.videos_since_restart = 0
-        self.stats = {'total': 0, 'success': 0, 'failed': 0, 'start_time': None}
+        # Memory-pressure state since the last browser start (see crawl_single)
+        self._pressure_rotations = 0
+        self._next_memory_check = self.config.min_videos_between_restarts
+        self.stats = CrawlStats()
         self.failed_urls = []  # Track failed URLs for retry
         self.browser_type = 'chromium'  # Default browser
         
@@ -564,13 +1011,32 @@ class SequentialTikTokCrawler:
         # v3.2: Date stats
         self.dates_preserved = 0
         self.dates_updated = 0
+
+        # Monotonic end time of the last request per context (for delay throttling)
+        self._last_request_end: Dict[int, float] = {}
+
+        # Parallel workers share one browser: only the first worker to notice a
+        # dead browser restarts it, the others see the bumped generation and retry
+        self._restart_lock = asyncio.Lock()
+        # Serializes lazy context creation in _context_for
+        self._context_lock = asyncio.Lock()
+        self._browser_generation = 0
+
+        # Healthy page parked per context between videos (skips new_page + stealth setup)
+        self._idle_pages: Dict[int, Page] = {}
+
+        # Videos navigated per worker context since it was created (see rotate_context)
+        self._context_videos: Dict[int, int] = {}
+
+        # Shared pooled client for the HTTP fast path, opened on first use
+        self._http_client = None
+        # Consecutive fast-path misses; reset per crawl_all batch
+        self._fast_path_misses = 0
     
     async def start_browser(self, browser_type: str = 'chromium'):
         """Start or restart browser with stealth settings"""
         await self.close_browser()
         
-        gc.collect()
-        
         try:
             self.browser_type = browser_type
             self.playwright = await async_playwright().start()
@@ -585,8 +1051,6 @@ class SequentialTikTokCrawler:
                 '--disable-web-security',
                 '--disable-features=IsolateOrigins,site-per-process',
                 '--no-first-run',
-                '--no-zygote',
-                '--single-process',
                 '--disable-infobars',
                 # Disable rendering features not needed for data extraction
                 '--blink-settings=imagesEnabled=false',
@@ -602,25 +1066,14 @@ class SequentialTikTokCrawler:
                 args=launch_args
             )
             
-            # Create context with realistic settings, smaller viewport saves RAM
-            self.context = await self.browser.new_context(
-                viewport={'width': 1280, 'height': 720},
-                user_agent=random.choice(USER_AGENTS),
-                locale='en-US',
-                timezone_id='Asia/Ho_Chi_Minh',
-                java_script_enabled=True,
-                bypass_csp=True,
-                ignore_https_errors=True,
-                has_touch=False,
-                is_mobile=False,
-                device_scale_factor=1,
-                color_scheme='light',
-            )
-            
-            # Apply stealth script
-            await self.context.add_init_script(STEALTH_SCRIPT)
+            self.context = await self._new_context()
+            self.contexts = [self.context]
+            self._context_videos = {}
+            self._browser_generation += 1
             
             self.videos_since_restart = 0
+            self._pressure_rotations = 0
+            self._next_memory_check = self.config.min_videos_between_restarts
             self.consecutive_crashes = 0
             logger.info(f"✅ {browser_type.title()} browser started successfully")
             return True
@@ -629,28 +1082,114 @@ class SequentialTikTokCrawler:
             logger.error(f"❌ Failed to start {browser_type} browser: {e}")
             return False
     
+    async def _new_context(self) -> BrowserContext:
+        """Create a context on the running browser with stealth + resource blocking"""
+        # Realistic settings; only the user agent changes per context
+        context = await self.browser.new_context(user_agent=next(_UA_CYCLE), **_CONTEXT_OPTIONS)
+        
+        # Apply stealth script + resource blocking — independent RPCs, send together
+        await asyncio.gather(
+            context.add_init_script(STEALTH_SCRIPT),
+            context.route("**/*", block_unneeded_resources),
+        )
+        return context
+    
+    def _context_needs_rotation(self, worker: int) -> bool:
+        """This worker's context has served its quota of videos"""
+        return self._context_videos.get(worker, 0) >= self.config.restart_browser_every
+    
+    async def _context_for(self, worker: int) -> BrowserContext:
+        """Context owned by a worker, created on first use after each browser start"""
+        if len(self.contexts) <= worker:
+            # Workers reaching here together must not each append a context
+            async with self._context_lock:
+                while len(self.contexts) <= worker:
+                    self.contexts.append(await self._new_context())
+        return self.contexts[worker]
+    
+    async def rotate_context(self, worker: int) -> BrowserContext:
+        """
+        Replace a worker's context with a fresh one, keeping the browser warm.
+        Triggered by a video count, or by memory pressure (see crawl_single).
+        Playwright retains request/response objects per context until it closes,
+        so this gives the memory reset of a browser restart at a fraction of the cost.
+        """
+        old = self.contexts[worker]
+        context = await self._new_context()
+        self.contexts[worker] = context
+        if worker == 0:
+            self.context = context
+        self._context_videos[worker] = 0
+        self._idle_pages.pop(id(old), None)
+        last_end = self._last_request_end.pop(id(old), None)
+        if last_end is not None:
+            self._last_request_end[id(context)] = last_end
+        await safe_close(old)
+        logger.debug("♻️ Rotated context for worker %d", worker)
+        return context
+    
+    async def _acquire_page(self, context: BrowserContext) -> Page:
+        """Take the parked page for this context, or open (and stealth) a new one"""
+        page = self._idle_pages.pop(id(context), None)
+        if page is not None and not page.is_closed():
+            return page
+        page = await context.new_page()
+        if STEALTH_AVAILABLE:
+            await stealth_async(page)
+        return page
+    
+    async def _release_page(self, context: BrowserContext, page: Page, reusable: bool):
+        """Park a healthy page for the next video on this context, close anything else"""
+        if reusable and not page.is_closed():
+            displaced = self._idle_pages.get(id(context))
+            self._idle_pages[id(context)] = page
+            if displaced is None or displaced is page:
+                return
+            # Never drop a parked page on the floor: it would stay open until the context closes
+            page = displaced
+        await safe_close(page)
+    
+    async def _restart_browser(self, generation: int, crashed: bool = False) -> bool:
+        """Restart the shared browser unless another worker already did since `generation`"""
+        async with self._restart_lock:
+            if generation != self._browser_generation and self.browser:
+                return True
+            if crashed:
+                self.consecutive_crashes += 1
+                self.total_crashes += 1
+                logger.warning(f"🔄 Browser issue ({self.consecutive_crashes}/{self.config.max_consecutive_crashes}), restarting...")
+                await asyncio.sleep(self.config.crash_restart_delay)
+            return await self.start_browser(self.browser_type)
+    
     async def close_browser(self):
         """Close browser with timeout protection"""
         async def _close():
             try:
-                if self.context:
-                    await self.context.close()
-                    self.context = None
-            except:
+                contexts = self.contexts or ([self.context] if self.context else [])
+                # Close leftover pages concurrently rather than letting
+                # context.close() tear them down one round-trip at a time
+                pages = [p for c in contexts for p in c.pages]
+                if pages:
+                    await asyncio.gather(*(p.close() for p in pages), return_exceptions=True)
+                await asyncio.gather(*(c.close() for c in contexts), return_exceptions=True)
+                self.context = None
+                self.contexts = []
+                self._idle_pages = {}
+            except Exception:
                 pass
             
             try:
                 if self.browser:
                     await self.browser.close()
                     self.browser = None
-            except:
+            except Exception:
                 pass
             
             try:
                 if self.playwright:
                     await self.playwright.stop()
                     self.playwright = None
-            except:
+            except Exception:
                 pass
         
         try:
@@ -658,308 +1197,338 @@ class SequentialTikTokCrawler:
         except asyncio.TimeoutError:
             logger.warning(f"⚠️ Browser close timed out, force killing...")
             self.context = None
+            self.contexts = []
+            self._idle_pages = {}
             self.browser = None
             self.playwright = None
         
-        gc.collect()
+        collect_garbage(self.config.gc_threshold_mb)
+    
+    def _success_result(self, url: str, data: Dict, existing_publish_date: Optional[str], elapsed: float) -> Dict:
+        """Count, log and shape a successful extraction (browser or fast path)"""
+        self.stats.success += 1
+    
+        # v3.2: Smart publish_date handling
+        final_publish_date = data.get('publish_date')
     
-    async def crawl_single(self, url: str, existing_publish_date: Optional[str] = None, retry_count: int = 0) -> Dict:
+        if self.config.preserve_existing_publish_date:
+            if is_valid_publish_date(existing_publish_date):
+                # Keep existing date
+                final_publish_date = existing_publish_date
+                self.dates_preserved += 1
+                logger.debug("📅 Preserved existing date: %s", existing_publish_date)
+            elif is_valid_publish_date(data.get('publish_date')):
+                # Use new date from crawl
+                final_publish_date = data.get('publish_date')
+                self.dates_updated += 1
+                logger.debug("📅 Updated date: %s", final_publish_date)
+            else:
+                final_publish_date = None
+    
+        channel_id = data.get('channel_id', '')
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ [%d/%d] Views: %s | Date: %s | Channel: @%s | %.1fs",
+                self.stats.success, self.stats.total, format(data['views'], ','),
+                final_publish_date or 'N/A', channel_id or '?', elapsed,
+            )
+
+        return {
+            'url': url,
+            'success': True,
+            'views': data['views'],
+            'likes': data.get('likes', 0),
+            'comments': data.get('comments', 0),
+            'shares': data.get('shares', 0),
+            'publish_date': final_publish_date,
+            'channel_id': channel_id,
+            'is_broken': False
+        }
+    
+    async def _fast_fetch(self, url: str) -> Optional[Dict]:
+        """
+        Fetch the video page over plain HTTP and read the server-rendered
+        UNIVERSAL_DATA blob. Returns extracted data, or None to fall back to
+        the browser (blob missing, bot check, non-200, network error).
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=self.config.http_timeout,
+                limits=httpx.Limits(max_connections=max(2, self.config.concurrency * 2)),
+                headers={'Accept-Language': 'en-US,en;q=0.9'},
+            )
+        try:
+            response = await self._http_client.get(url, headers={'User-Agent': next(_UA_CYCLE)})
+        except httpx.HTTPError as e:
+            logger.debug("Fast path request failed: %s", e)
+            return None
+        if response.status_code != 200:
+            return None
+        try:
+            return await extract_from_html(response.content)
+        except Exception as e:
+            logger.debug("Fast path parse failed: %s", e)
+            return None
+    
+    async def _data_from_response(self, response) -> Optional[Dict]:
+        """
+        Read the navigation's document body off the wire and extract from it,
+        so a server-rendered page never waits for DOM/JS. None falls back to the page.
+        """
+        if response is None or response.status != 200:
+            return None
+        try:
+            body = await asyncio.wait_for(response.body(), timeout=self.config.data_wait_ms / 1000)
+            return await extract_from_html(body)
+        except Exception as e:
+            logger.debug("Document body extraction failed: %s", e)
+            return None
+    
+    async def close_http_client(self):
+        """Close the fast-path HTTP client, if one was opened"""
+        if self._http_client is not None:
+            try:
+                await self._http_client.aclose()
+            except Exception:
+                pass
+            self._http_client = None
+    
+    async def crawl_single(self, url: str, existing_publish_date: Optional[str] = None, retry_count: int = 0,
+                           delay: Optional[float] = None, worker: int = 0, validated: bool = False) -> Dict:
         """
         Crawl a single URL with publish date priority
         
         Args:
             url: TikTok video URL
             existing_publish_date: Current publish_date from Lark (to preserve if valid)
-            retry_count: Current retry attempt
+            retry_count: Attempts already used (retries run in a loop, not recursively)
+            delay: Pre-drawn human-like delay (drawn here if not given)
+            worker: Worker slot whose context to use (crawl_all runs several in parallel)
+            validated: URL is already cleaned by validate_tiktok_url (crawl_all precheck)
         
         Returns:
             Dict with crawl results
         """
         
         # Validate URL first
-        is_valid, result = validate_tiktok_url(url)
-        if not is_valid:
-            logger.warning(f"❌ Invalid URL skipped: {result}")
-            self.stats['failed'] += 1
-            # v3.2: Return empty values for invalid URLs (broken link)
-            return {
-                'url': url, 
-                'success': False, 
-                'views': None,
-                'likes': None,
-                'comments': None,
-                'shares': None,
-                'publish_date': None,
-                'error': result,
-                'is_broken': True
-            }
-        
-        url = result  # Use cleaned URL
-        
-        # Check crash limit (v3.1)
-        if self.consecutive_crashes >= self.config.max_consecutive_crashes:
-            logger.error(f"🛑 Too many consecutive crashes ({self.consecutive_crashes}), skipping: {url[:50]}...")
-            self.stats['failed'] += 1
-            self.failed_urls.append(url)
-            self.consecutive_crashes = 0
-            return {
-                'url': url, 
-                'success': False, 
-                'views': None,
-                'likes': None,
-                'comments': None,
-                'shares': None,
-                'publish_date': existing_publish_date if is_valid_publish_date(existing_publish_date) else None,
-                'error': 'Too many consecutive crashes',
-                'is_broken': False  # Not broken, just crashed - preserve date
-            }
-        
-        # Check if browser restart needed
-        if self.videos_since_restart >= self.config.restart_browser_every:
-            logger.info(f"🔄 Restarting browser after {self.videos_since_restart} videos...")
-            await self.start_browser(self.browser_type)
-            gc.collect()
-        
-        # Ensure browser is running
-        if not self.browser or not self.context:
-            if not await self.start_browser(self.browser_type):
-                return {
-                    'url': url, 
-                    'success': False, 
-                    'views': None,
-                    'likes': None,
-                    'comments': None,
-                    'shares': None,
-                    'publish_date': existing_publish_date if is_valid_publish_date(existing_publish_date) else None,
-                    'error': 'Browser failed to start',
-                    'is_broken': False
-                }
-        
-        page = None
-        start_time = time.time()
-        
-        try:
-            # Random human-like delay
-            delay = random.uniform(*self.config.delay_range)
-            await asyncio.sleep(delay)
+        if not validated:
+            is_valid, result = validate_tiktok_url(url)
+            if not is_valid:
+                logger.warning(f"❌ Invalid URL skipped: {result}")
+                self.stats.failed += 1
+                # v3.2: Return empty values for invalid URLs (broken link)
+                return build_failed_result(url, result, is_broken=True)
             
-            # Create new page
-            page = await self.context.new_page()
-
-            # ── RESOURCE BLOCKING ─────────────────────────────────────────────
-            # Block heavy resources we don't need (images, media, fonts, CSS).
-            # TikTok video data lives in JSON <script> tags — nothing visual needed.
-            # This alone cuts page-load time ~40% and RAM usage significantly.
-            async def _block_resource(route):
-                if route.request.resource_type in ("image", "media", "font", "stylesheet"):
-                    await route.abort()
-                elif any(x in route.request.url for x in ("analytics", "tracker", "beacon", "sentry", "monitoring")):
-                    await route.abort()
-                else:
-                    await route.continue_()
-            await page.route("**/*", _block_resource)
-            # ── END RESOURCE BLOCKING ─────────────────────────────────────────
+            url = result  # Use cleaned URL
+        # Existing date is kept on every non-broken failure
+        preserved_date = existing_publish_date if is_valid_publish_date(existing_publish_date) else None
+
+        if delay is None:
+            delay = random.uniform(*self.config.delay_range)
 
-            # Apply playwright-stealth if available
-            if STEALTH_AVAILABLE:
-                await stealth_async(page)
+        # Fast path: most video pages carry the data blob in the server HTML,
+        # so try a plain request first and only fall back to the browser
+        if (self.config.http_fast_path and HTTPX_AVAILABLE and retry_count == 0
+                and self._fast_path_misses < self.config.http_max_misses):
+            start_time = time.time()
+            await asyncio.sleep(delay)
+            data = await self._fast_fetch(url)
+            if data:
+                self._fast_path_misses = 0
+                return self._success_result(url, data, existing_publish_date, time.time() - start_time)
+            # Plain HTTP getting challenge pages: stop paying for it on every URL
+            self._fast_path_misses += 1
+            if self._fast_path_misses == self.config.http_max_misses:
+                logger.info(f"🐢 HTTP fast path missed {self._fast_path_misses} times in a row, browser only from here")
+            # The browser attempt below already waited out this delay
+            delay = 0.0
 
-            # Navigate to video
-            await page.goto(url, wait_until='domcontentloaded', timeout=self.config.timeout_ms)
+        for attempt in range(min(retry_count, self.config.max_retries), self.config.max_retries + 1):
+            # Check crash limit (v3.1)
+            if self.consecutive_crashes >= self.config.max_consecutive_crashes:
+                logger.error(f"🛑 Too many consecutive crashes ({self.consecutive_crashes}), skipping: {url[:50]}...")
+                self.stats.failed += 1
+                self.failed_urls.append(url)
+                self.consecutive_crashes = 0
+                # Not broken, just crashed - preserve date
+                return build_failed_result(url, 'Too many consecutive crashes', preserved_date)
+            
+            generation = self._browser_generation
+            
+            # Memory pressure: recycle this worker's context first, which leaves the
+            # other workers' pages alone; relaunch Chromium only once every context
+            # has been recycled and usage is still over the limit
+            if self.browser and self.videos_since_restart >= self._next_memory_check:
+                # Next reading (a /proc walk) no sooner than N videos from now
+                self._next_memory_check = self.videos_since_restart + self.config.min_videos_between_restarts
+                memory_mb = get_memory_usage_mb()
+                if memory_mb > self.config.max_rss_mb:
+                    if worker < len(self.contexts) and self._pressure_rotations < len(self.contexts):
+                        self._pressure_rotations += 1
+                        logger.info(f"♻️ Recycling worker {worker}'s context at {memory_mb:.0f}MB...")
+                        await self.rotate_context(worker)
+                    else:
+                        logger.info(
+                            f"🔄 Restarting browser at {memory_mb:.0f}MB "
+                            f"after {self.videos_since_restart} videos..."
+                        )
+                        await self._restart_browser(generation)
+                        generation = self._browser_generation
+            
+            # Ensure browser is running - also relaunch one that died while idle
+            # (e.g. OOM-killed between API calls) before spending an attempt on it
+            if not self.browser or not self.context or not self.browser.is_connected():
+                # A disconnected browser is a crash, counted once whichever worker restarts it
+                died = self.browser is not None and not self.browser.is_connected()
+                if not await self._restart_browser(generation, crashed=died):
+                    return build_failed_result(url, 'Browser failed to start', preserved_date)
+                generation = self._browser_generation
             
-            # Wait for JavaScript to render
-            await asyncio.sleep(self.config.wait_after_load)
+            page = None
+            context = None
+            page_reusable = False
+            start_time = time.time()
             
-            # Additional wait for dynamic content
             try:
-                await page.wait_for_selector('script#__UNIVERSAL_DATA_FOR_REHYDRATION__', timeout=5000)
-            except:
-                pass
+                context = await self._context_for(worker)
+                if self._context_needs_rotation(worker):
+                    context = await self.rotate_context(worker)
+                
+                # Random human-like delay — only the part not already spent
+                # since the previous request on this context finished
+                since_last = time.monotonic() - self._last_request_end.get(id(context), 0.0)
+                if delay > since_last:
+                    await asyncio.sleep(delay - since_last)
+            
+                # Reuse this worker's page (resource blocking is registered on the context)
+                page = await self._acquire_page(context)
+                self._context_videos[worker] = self._context_videos.get(worker, 0) + 1
+
+                # Navigate to video - return as soon as the response commits;
+                # the data blob is server-rendered, so wait for it, not a fixed sleep
+                response = await page.goto(url, wait_until='commit', timeout=self.config.timeout_ms)
+                
+                # Server-rendered HTML already carries the blob: done before the DOM is
+                data = await self._data_from_response(response)
+                if data:
+                    page_reusable = True
+                    self.videos_since_restart += 1
+                    self.consecutive_crashes = 0
+                    return self._success_result(url, data, existing_publish_date, time.time() - start_time)
+            
+                # Script tags are never "visible": wait for them to be attached
+                try:
+                    await page.wait_for_selector(_DATA_SCRIPT_SELECTOR, state='attached',
+                                                 timeout=self.config.data_wait_ms)
+                except Exception:
+                    pass
 
-            # ── FAST-FAIL CHECK ──────────────────────────────────────────────
-            # Detect immediately if TikTok has no data on this page so we avoid
-            # running all 5 extraction methods + 3 retries (~40-50s wasted).
-            page_status = await check_page_data_status(page)
+                # ── FAST-FAIL CHECK ──────────────────────────────────────────────
+                # Detect immediately if TikTok has no data on this page so we avoid
+                # running all 5 extraction methods + 3 retries (~40-50s wasted).
+                page_status = await check_page_data_status(page)
+                # Navigation and evaluate worked: the page is healthy enough to reuse
+                page_reusable = True
 
-            if page_status == 'broken':
-                elapsed = time.time() - start_time
-                logger.warning(f"🔗 Fast-fail (broken) {elapsed:.1f}s: {url[:60]}...")
-                self.stats['failed'] += 1
-                return {
-                    'url': url, 'success': False, 'views': None,
-                    'likes': None, 'comments': None, 'shares': None,
-                    'publish_date': None,
-                    'error': 'video_unavailable', 'is_broken': True,
-                    'pending_propagation': False,
-                }
+                if page_status == 'broken':
+                    elapsed = time.time() - start_time
+                    logger.warning(f"🔗 Fast-fail (broken) {elapsed:.1f}s: {url[:60]}...")
+                    self.stats.failed += 1
+                    return build_failed_result(url, 'video_unavailable', is_broken=True)
 
-            if page_status == 'pending':
-                elapsed = time.time() - start_time
-                logger.info(f"⏳ Fast-fail (pending) {elapsed:.1f}s: {url[:60]}...")
-                # Do NOT count as a failure — video will be retried later
-                return {
-                    'url': url, 'success': False, 'views': None,
-                    'likes': None, 'comments': None, 'shares': None,
-                    # Preserve existing date so date-filter works next run
-                    'publish_date': existing_publish_date if is_valid_publish_date(existing_publish_date) else None,
-                    'error': 'pending_propagation', 'is_broken': False,
-                    'pending_propagation': True,
-                }
-            # ── END FAST-FAIL ────────────────────────────────────────────────
+                if page_status == 'pending':
+                    elapsed = time.time() - start_time
+                    logger.info(f"⏳ Fast-fail (pending) {elapsed:.1f}s: {url[:60]}...")
+                    # Do NOT count as a failure — video will be retried later.
+                    # Preserve existing date so date-filter works next run.
+                    return build_failed_result(url, 'pending_propagation', preserved_date,
+                                               pending_propagation=True)
+                # ── END FAST-FAIL ────────────────────────────────────────────────
 
-            # Extract data
-            data = await extract_video_data(page, url)
+                # Extract data - methods run cheapest first; one deadline caps the whole chain
+                try:
+                    data = await asyncio.wait_for(extract_video_data(page, url),
+                                                  timeout=self.config.extract_timeout_ms / 1000)
+                except asyncio.TimeoutError:
+                    logger.warning(f"⏱️ Extraction over {self.config.extract_timeout_ms}ms: {url[:60]}...")
+                    page_reusable = False  # a page that stalls an evaluate is not worth keeping
+                    data = None
             
-            self.videos_since_restart += 1
-            self.consecutive_crashes = 0
-            elapsed = time.time() - start_time
+                self.videos_since_restart += 1
+                self.consecutive_crashes = 0
+                elapsed = time.time() - start_time
             
-            if data and data.get('views', 0) > 0:
-                self.stats['success'] += 1
-                
-                # v3.2: Smart publish_date handling
-                final_publish_date = data.get('publish_date')
-                
-                if self.config.preserve_existing_publish_date:
-                    if is_valid_publish_date(existing_publish_date):
-                        # Keep existing date
-                        final_publish_date = existing_publish_date
-                        self.dates_preserved += 1
-                        logger.debug(f"📅 Preserved existing date: {existing_publish_date}")
-                    elif is_valid_publish_date(data.get('publish_date')):
-                        # Use new date from crawl
-                        final_publish_date = data.get('publish_date')
-                        self.dates_updated += 1
-                        logger.debug(f"📅 Updated date: {final_publish_date}")
-                    else:
-                        final_publish_date = None
-                
-                channel_id = data.get('channel_id', '')
-                logger.info(
-                    f"✅ [{self.stats['success']}/{self.stats['total']}] "
-                    f"Views: {data['views']:,} | Date: {final_publish_date or 'N/A'} | "
-                    f"Channel: @{channel_id or '?'} | {elapsed:.1f}s"
-                )
-
-                return {
-                    'url': url,
-                    'success': True,
-                    'views': data['views'],
-                    'likes': data.get('likes', 0),
-                    'comments': data.get('comments', 0),
-                    'shares': data.get('shares', 0),
-                    'publish_date': final_publish_date,
-                    'channel_id': channel_id,
-                    'is_broken': False
-                }
-            else:
-                raise Exception("No data extracted")
+                if data and data.get('views', 0) > 0:
+                    return self._success_result(url, data, existing_publish_date, elapsed)
+                else:
+                    raise Exception("No data extracted")
                 
-        except PlaywrightTimeout:
-            elapsed = time.time() - start_time
-            logger.warning(f"⏱️ Timeout after {elapsed:.1f}s: {url[:60]}...")
+            except PlaywrightTimeout:
+                elapsed = time.time() - start_time
+                logger.warning(f"⏱️ Timeout after {elapsed:.1f}s: {url[:60]}...")
             
-            if retry_count < self.config.max_retries:
-                await self.start_browser(self.browser_type)
-                return await self.crawl_single(url, existing_publish_date, retry_count + 1)
+                # A navigation timeout leaves the browser healthy — back off, retry on a fresh page
+                if attempt < self.config.max_retries:
+                    await asyncio.sleep(retry_backoff(attempt))
+                    continue
             
-            self.stats['failed'] += 1
-            self.failed_urls.append(url)
+                self.stats.failed += 1
+                self.failed_urls.append(url)
             
-            # Timeout — don't assume broken, preserve existing date
-            return {
-                'url': url,
-                'success': False,
-                'views': None,
-                'likes': None,
-                'comments': None,
-                'shares': None,
-                'publish_date': existing_publish_date if is_valid_publish_date(existing_publish_date) else None,
-                'error': 'Timeout',
-                'is_broken': False,
-                'pending_propagation': False,
-            }
+                # Timeout — don't assume broken, preserve existing date
+                return build_failed_result(url, 'Timeout', preserved_date)
             
-        except Exception as e:
-            error_msg = str(e)[:100]
-            elapsed = time.time() - start_time
+            except Exception as e:
+                error_msg = short_error_message(e)
+                elapsed = time.time() - start_time
             
-            # Browser crashed - restart with protection
-            if any(x in error_msg.lower() for x in ['closed', 'target', 'crashed', 'disconnected']):
-                self.consecutive_crashes += 1
-                self.total_crashes += 1
-                logger.warning(f"🔄 Browser issue ({self.consecutive_crashes}/{self.config.max_consecutive_crashes}), restarting...")
-                
-                await asyncio.sleep(self.config.crash_restart_delay)
-                gc.collect()
-                
-                await self.start_browser(self.browser_type)
+                # Browser crashed (page/context gone or browser disconnected) - restart with protection
+                browser_dead = (
+                    page is None
+                    or page.is_closed()
+                    or not self.browser
+                    or not self.browser.is_connected()
+                )
+                if browser_dead:
+                    # Counted and restarted once, by whichever worker gets there first
+                    await self._restart_browser(generation, crashed=True)
                 
-                if retry_count < self.config.max_retries:
-                    return await self.crawl_single(url, existing_publish_date, retry_count + 1)
+                    if attempt < self.config.max_retries:
+                        continue
             
-            # Retry for other errors
-            if retry_count < self.config.max_retries:
-                await asyncio.sleep(2 + retry_count)
-                return await self.crawl_single(url, existing_publish_date, retry_count + 1)
+                # Retry for other errors
+                if attempt < self.config.max_retries:
+                    await asyncio.sleep(retry_backoff(attempt))
+                    continue
             
-            self.stats['failed'] += 1
-            self.failed_urls.append(url)
+                self.stats.failed += 1
+                self.failed_urls.append(url)
             
-            # Determine if broken link.
-            # NOTE: 'no data extracted' is NOT included here — that error means
-            # extraction failed but the video may still exist (e.g. TikTok changed
-            # their HTML structure). Clearing data for that would be destructive.
-            is_broken = any(x in error_msg.lower() for x in ['not found', 'unavailable', 'removed', '404'])
-            # Also propagate the pending_propagation flag from fast-fail if it
-            # somehow reaches the exception path.
-            is_pending = 'pending_propagation' in error_msg.lower()
+                # Determine if broken link.
+                # NOTE: 'no data extracted' is NOT included here — that error means
+                # extraction failed but the video may still exist (e.g. TikTok changed
+                # their HTML structure). Clearing data for that would be destructive.
+                is_broken = _BROKEN_ERROR_RE.search(error_msg) is not None
+                # Also propagate the pending_propagation flag from fast-fail if it
+                # somehow reaches the exception path.
+                is_pending = _PENDING_ERROR_RE.search(error_msg) is not None
             
-            if is_pending:
-                return {
-                    'url': url,
-                    'success': False,
-                    'views': None, 'likes': None, 'comments': None, 'shares': None,
-                    'publish_date': existing_publish_date if is_valid_publish_date(existing_publish_date) else None,
-                    'error': error_msg,
-                    'is_broken': False,
-                    'pending_propagation': True,
-                }
-            elif is_broken and self.config.clear_data_on_broken_link:
-                logger.warning(f"🔗 Broken link: {error_msg}")
-                return {
-                    'url': url,
-                    'success': False,
-                    'views': None,
-                    'likes': None,
-                    'comments': None,
-                    'shares': None,
-                    'publish_date': None,  # Clear for broken
-                    'error': error_msg,
-                    'is_broken': True,
-                    'pending_propagation': False,
-                }
-            else:
-                # Not broken, just failed - preserve date if exists
-                return {
-                    'url': url,
-                    'success': False,
-                    'views': None,
-                    'likes': None,
-                    'comments': None,
-                    'shares': None,
-                    'publish_date': existing_publish_date if is_valid_publish_date(existing_publish_date) else None,
-                    'error': error_msg,
-                    'is_broken': False,
-                    'pending_propagation': False,
-                }
+                if is_pending:
+                    return build_failed_result(url, error_msg, preserved_date, pending_propagation=True)
+                elif is_broken and self.config.clear_data_on_broken_link:
+                    logger.warning(f"🔗 Broken link: {error_msg}")
+                    # Clear date for broken
+                    return build_failed_result(url, error_msg, is_broken=True)
+                else:
+                    # Not broken, just failed - preserve date if exists
+                    return build_failed_result(url, error_msg, preserved_date)
             
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except:
-                    pass
+            finally:
+                if page:
+                    await self._release_page(context, page, page_reusable)
+                if context is not None:
+                    self._last_request_end[id(context)] = time.monotonic()
     
     async def retry_failed_with_firefox(self, failed_urls: List[str], existing_dates: Dict[str, str] = None) -> List[Dict]:
         """Retry failed URLs using Firefox browser"""
@@ -992,7 +1561,9 @@ class SequentialTikTokCrawler:
     
     async def crawl_all(self, urls: List[str], existing_dates: Dict[str, str] = None) -> List[Dict]:
         """
-        Crawl all URLs with retry for failed videos
+        Crawl all URLs with retry for failed videos.
+        Runs config.concurrency workers on one shared browser, one context each;
+        results keep the order of `urls`.
         
         Args:
             urls: List of TikTok video URLs
@@ -1003,108 +1574,181 @@ class SequentialTikTokCrawler:
         """
         existing_dates = existing_dates or {}
         
-        self.stats = {
-            'total': len(urls),
-            'success': 0,
-            'failed': 0,
-            'start_time': time.time(),
-        }
+        self.stats = CrawlStats(total=len(urls), start_time=time.time())
         self.failed_urls = []
+        self._fast_path_misses = 0
         self.consecutive_crashes = 0
         self.total_crashes = 0
         self.dates_preserved = 0
         self.dates_updated = 0
         
-        logger.info(f"📊 Starting SEQUENTIAL crawl v3.2 of {len(urls)} URLs")
-        logger.info(f"⚙️ Config: Timeout={self.config.timeout_ms}ms, Restart every {self.config.restart_browser_every} videos")
+        results: List[Optional[Dict]] = [None] * len(urls)
+        final_success = 0
+        final_broken = 0
+        
+        def emit(i: int, result: Dict):
+            """Store a slot's result and keep the final tallies current"""
+            nonlocal final_success, final_broken
+            old = results[i]
+            if old is not None:
+                final_success -= bool(old.get('success'))
+                final_broken -= bool(old.get('is_broken'))
+            results[i] = result
+            final_success += bool(result.get('success'))
+            final_broken += bool(result.get('is_broken'))
+        
+        # Precheck pass: validate each URL and its existing date once, up front.
+        # Invalid URLs are answered here; each distinct cleaned URL is crawled once
+        # and repeats get a copy of the first result.
+        first_index: Dict[str, int] = {}
+        duplicates: List[Tuple[int, int]] = []
+        cleaned_urls: List[Optional[str]] = [None] * len(urls)
+        dates_by_url: Dict[str, str] = {}
+        valid_dates_count = 0
+        for i, url in enumerate(urls):
+            is_valid, cleaned = validate_tiktok_url(url)
+            if not is_valid:
+                logger.warning(f"❌ Invalid URL skipped: {cleaned}")
+                self.stats.failed += 1
+                emit(i, build_failed_result(url, cleaned, is_broken=True))
+                continue
+            cleaned_urls[i] = cleaned
+            
+            existing_date = existing_dates.get(url, '')
+            if is_valid_publish_date(existing_date):
+                valid_dates_count += 1
+            else:
+                existing_date = ''
+            
+            if cleaned in first_index:
+                duplicates.append((i, first_index[cleaned]))
+            else:
+                first_index[cleaned] = i
+                dates_by_url[cleaned] = existing_date
+        if duplicates:
+            logger.info(f"♻️ {len(duplicates)} duplicate URLs will reuse the first crawl's result")
+        
+        workers = max(1, min(self.config.concurrency, len(first_index)))
+        logger.info(f"📊 Starting crawl v3.2 of {len(urls)} URLs with {workers} parallel worker(s)")
+        logger.info(f"⚙️ Config: Timeout={self.config.timeout_ms}ms, Restart above {self.config.max_rss_mb}MB")
         logger.info(f"🛡️ Crash protection: Max {self.config.max_consecutive_crashes} consecutive crashes")
         logger.info(f"📅 Publish date: Preserve existing={self.config.preserve_existing_publish_date}, Clear broken={self.config.clear_data_on_broken_link}")
-        
-        # Count existing dates
-        valid_dates_count = sum(1 for d in existing_dates.values() if is_valid_publish_date(d))
         logger.info(f"📅 Existing valid dates: {valid_dates_count}/{len(urls)}")
         
-        # Start browser
-        if not await self.start_browser():
+        # Start browser (not needed when every URL failed the precheck)
+        if first_index and not await self.start_browser():
             logger.error("❌ Cannot start browser, aborting")
             return []
+
+        # Draw all human-like delays up front instead of one RNG call per video
+        delay_min, delay_max = self.config.delay_range
+        uniform = random.uniform
+        delays = [uniform(delay_min, delay_max) for _ in urls]
         
-        results = []
+        def fill_duplicates():
+            for i, source in duplicates:
+                if results[source] is not None and results[i] != results[source]:
+                    emit(i, dict(results[source]))
         
-        try:
-            for idx, url in enumerate(urls, 1):
+        # Workers pull indexes from one shared iterator; each owns a context
+        pending = iter(first_index.values())
+        done = 0
+        n = len(urls)
+        
+        async def worker(slot: int):
+            nonlocal done
+            for i in pending:
+                url = cleaned_urls[i]
+                idx = i + 1
                 # Progress log every 25 videos
-                if idx % 25 == 1 or idx == len(urls):
-                    elapsed = time.time() - self.stats['start_time']
-                    rate = idx / elapsed if elapsed > 0 else 0
-                    eta = (len(urls) - idx) / rate / 60 if rate > 0 else 0
-                    success_rate = (self.stats['success'] / idx * 100) if idx > 0 else 0
+                if (idx % 25 == 1 or idx == n) and logger.isEnabledFor(logging.INFO):
+                    elapsed = time.time() - self.stats.start_time
+                    rate = done / elapsed if elapsed > 0 else 0
+                    eta = (n - done) / rate / 60 if rate > 0 else 0
+                    success_rate = (self.stats.success / done * 100) if done > 0 else 0
                     
                     logger.info(
-                        f"📈 Progress: {idx}/{len(urls)} ({idx/len(urls)*100:.0f}%) | "
-                        f"✅ {self.stats['success']} ({success_rate:.0f}%) | "
-                        f"📅 Dates: {self.dates_preserved} preserved, {self.dates_updated} updated | "
-                        f"💥 Crashes: {self.total_crashes} | "
-                        f"ETA: {eta:.0f}min"
+                        "📈 Progress: %d/%d (%.0f%%) | ✅ %d (%.0f%%) | "
+                        "📅 Dates: %d preserved, %d updated | 💥 Crashes: %d | ETA: %.0fmin",
+                        idx, n, idx / n * 100, self.stats.success, success_rate,
+                        self.dates_preserved, self.dates_updated, self.total_crashes, eta,
                     )
                 
-                logger.info(f"Processing {idx}/{len(urls)}")
+                logger.debug("Processing %d/%d", idx, n)
                 
-                # Get existing date for this URL
-                existing_date = existing_dates.get(url, '')
-                
-                result = await self.crawl_single(url, existing_date)
-                results.append(result)
+                try:
+                    result = await self.crawl_single(url, dates_by_url[url], delay=delays[i],
+                                                     worker=slot, validated=True)
+                except Exception as e:
+                    logger.error(f"❌ Worker {slot} error on {url[:60]}: {e}")
+                    result = build_failed_result(url, short_error_message(e), dates_by_url[url] or None)
+                emit(i, result)
+                done += 1
                 
-                # Memory cleanup
-                if idx % self.config.memory_cleanup_interval == 0:
-                    gc.collect()
-            
-        finally:
-            await self.close_browser()
+                # Memory cleanup - young generations only, and only under memory pressure
+                if done % self.config.memory_cleanup_interval == 0:
+                    collect_garbage(self.config.gc_threshold_mb, 1)
         
-        # ===== RETRY FAILED VIDEOS =====
-        if self.config.retry_failed_at_end and self.failed_urls:
-            logger.info(f"\n{'='*50}")
-            logger.info(f"🔄 Retrying {len(self.failed_urls)} failed videos...")
-            logger.info(f"{'='*50}\n")
+        try:
+            # Open the extra worker contexts together instead of on first use
+            missing = workers - len(self.contexts)
+            if missing > 0:
+                self.contexts.extend(await asyncio.gather(*(self._new_context() for _ in range(missing))))
+            await asyncio.gather(*(worker(slot) for slot in range(workers)))
+            await self.close_browser()
             
-            retry_urls = self.failed_urls.copy()
-            self.failed_urls = []
-            self.consecutive_crashes = 0
+            fill_duplicates()
             
-            # First retry with Chromium (fresh browser)
-            if not await self.start_browser('chromium'):
-                logger.error("❌ Cannot restart browser for retry")
-            else:
-                for url in retry_urls:
-                    for i, r in enumerate(results):
-                        if r['url'] == url and not r['success']:
-                            existing_date = existing_dates.get(url, '')
-                            new_result = await self.crawl_single(url, existing_date, retry_count=0)
+            # ===== RETRY FAILED VIDEOS =====
+            if self.config.retry_failed_at_end and self.failed_urls:
+                logger.info(f"\n{'='*50}")
+                logger.info(f"🔄 Retrying {len(self.failed_urls)} failed videos...")
+                logger.info(f"{'='*50}\n")
+            
+                retry_urls = self.failed_urls.copy()
+                self.failed_urls = []
+                self.consecutive_crashes = 0
+            
+                # Result position per URL, so merging a retry is a dict lookup
+                idx_by_url: Dict[str, int] = {}
+                for i, r in enumerate(results):
+                    idx_by_url.setdefault(r['url'], i)
+            
+                # First retry with Chromium (fresh browser)
+                if not await self.start_browser('chromium'):
+                    logger.error("❌ Cannot restart browser for retry")
+                else:
+                    for url in retry_urls:
+                        i = idx_by_url.get(url)
+                        if i is not None and not results[i]['success']:
+                            new_result = await self.crawl_single(url, dates_by_url.get(url, ''), retry_count=0,
+                                                                 validated=True)
                             if new_result.get('success'):
-                                results[i] = new_result
+                                emit(i, new_result)
                                 if url in self.failed_urls:
                                     self.failed_urls.remove(url)
-                            break
                 
-                await self.close_browser()
+                    await self.close_browser()
             
-            # Firefox fallback for still-failed videos
-            if self.config.use_firefox_fallback and self.failed_urls:
-                firefox_results = await self.retry_failed_with_firefox(self.failed_urls.copy(), existing_dates)
+                # Firefox fallback for still-failed videos
+                if self.config.use_firefox_fallback and self.failed_urls:
+                    firefox_results = await self.retry_failed_with_firefox(self.failed_urls.copy(), dates_by_url)
                 
-                for fx_result in firefox_results:
-                    for i, r in enumerate(results):
-                        if r['url'] == fx_result['url'] and not r['success']:
-                            results[i] = fx_result
-                            break
+                    for fx_result in firefox_results:
+                        i = idx_by_url.get(fx_result['url'])
+                        if i is not None and not results[i]['success']:
+                            emit(i, fx_result)
+        finally:
+            # Reached on errors/cancellation too; the fast-path client stays open
+            # until here because the retry pass goes through the fast path again
+            await self.close_browser()
+            await self.close_http_client()
+        
+        fill_duplicates()
         
-        # Final stats
-        final_success = sum(1 for r in results if r.get('success'))
+        # Final stats (tallied by emit as results arrive)
         final_failed = len(results) - final_success
-        final_broken = sum(1 for r in results if r.get('is_broken'))
-        elapsed = time.time() - self.stats['start_time']
+        elapsed = time.time() - self.stats.start_time
         success_rate = (final_success / len(urls) * 100) if urls else 0
         
         logger.info(f"""
@@ -1142,13 +1786,28 @@ class TikTokPlaywrightCrawler:
     
     def __init__(self):
         self.config = CrawlerConfig()
+
+        # Long-lived event loop thread + crawler so single-video calls reuse a warm browser
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._single_crawler: Optional[SequentialTikTokCrawler] = None
+        # Single-video crawls all share _single_crawler's context: run them one
+        # at a time so none restarts or closes the browser under another
+        self._single_crawl_lock = asyncio.Lock()
+        # One batch at a time (later callers wait for it); single-video calls keep
+        # running alongside on the same loop
+        self._batch_lock = threading.Lock()
+        # Safety net for scripts that never call shutdown(); a no-op once it has run
+        atexit.register(self.shutdown)
+
         stealth_status = "enabled" if STEALTH_AVAILABLE else "disabled (install playwright-stealth for better results)"
         logger.info(f"✅ TikTokPlaywrightCrawler v3.2 initialized | Stealth: {stealth_status}")
     
     def get_tiktok_views(self, video_url: str) -> Optional[Dict]:
         """Get single video stats"""
         try:
-            return self._run_in_thread(self._async_get_single, video_url)
+            return self._run_on_loop(self._async_get_single, video_url)
         except Exception as e:
             logger.error(f"❌ Error: {e}")
             return None
@@ -1157,6 +1816,10 @@ class TikTokPlaywrightCrawler:
         """
         Crawl multiple URLs with retry logic
         
+        Batches run one at a time: a second caller (e.g. retry-pending firing
+        during the daily job) blocks until the running batch finishes, so at
+        most one batch browser is up on top of the single-video one.
+        
         Args:
             urls: List of TikTok video URLs
             existing_dates: Dict mapping URL -> existing publish_date (to preserve)
@@ -1164,7 +1827,8 @@ class TikTokPlaywrightCrawler:
         logger.info(f"📋 crawl_batch_sync v3.2 called with {len(urls)} URLs")
         
         try:
-            result = self._run_in_thread(self._async_batch, urls, existing_dates or {})
+            with self._batch_lock:
+                result = self._run_on_loop(self._async_batch, urls, existing_dates or {})
             success_count = sum(1 for r in result if r.get('success'))
             logger.info(f"✅ Completed: {success_count}/{len(result)} successful ({success_count/len(result)*100:.1f}%)")
             return result
@@ -1173,33 +1837,70 @@ class TikTokPlaywrightCrawler:
             logger.error(traceback.format_exc())
             return []
     
-    def _run_in_thread(self, async_func, *args):
-        """Run async function in separate thread"""
-        def thread_target():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the persistent event loop thread on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name='playwright-loop', daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _run_on_loop(self, async_func, *args, timeout: float = 18000):
+        """
+        Run async function on the persistent event loop and wait for the result.
+        On timeout the coroutine is cancelled too, so it can't keep running
+        (and holding a browser) after the caller has given up on it.
+        """
+        future = asyncio.run_coroutine_threadsafe(async_func(*args), self._get_loop())
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self):
+        """Close the shared browser and stop the persistent event loop"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None:
+            return
+
+        if self._single_crawler:
             try:
-                return loop.run_until_complete(async_func(*args))
-            finally:
-                loop.close()
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(thread_target)
-            return future.result(timeout=18000)  # 5 hour timeout
+                asyncio.run_coroutine_threadsafe(
+                    self._single_crawler.close_http_client(), loop
+                ).result(timeout=5)
+                asyncio.run_coroutine_threadsafe(
+                    self._single_crawler.close_browser(), loop
+                ).result(timeout=self.config.browser_close_timeout + 5)
+            except Exception as e:
+                logger.warning(f"⚠️ Shared browser close failed: {e}")
+            self._single_crawler = None
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread:
+            thread.join(timeout=5)
+        logger.info("✅ TikTokPlaywrightCrawler shut down")
     
     async def _async_get_single(self, url: str) -> Optional[Dict]:
-        """Async single video"""
-        crawler = SequentialTikTokCrawler(self.config)
-        try:
-            if not await crawler.start_browser():
-                return None
-            result = await crawler.crawl_single(url)
-            return result if result.get('success') else None
-        finally:
-            await crawler.close_browser()
+        """Async single video on the shared browser (started on first use)"""
+        if self._single_crawler is None:
+            self._single_crawler = SequentialTikTokCrawler(self.config)
+        async with self._single_crawl_lock:
+            result = await self._single_crawler.crawl_single(url)
+        return result if result.get('success') else None
     
     async def _async_batch(self, urls: List[str], existing_dates: Dict[str, str]) -> List[Dict]:
-        """Async batch with retry"""
+        """
+        Async batch with retry, on the persistent loop.
+        Uses its own crawler so the batch's browser teardown and stats never
+        touch the warm single-video browser.
+        """
         crawler = SequentialTikTokCrawler(self.config)
         try:
             return await crawler.crawl_all(urls, existing_dates)
@@ -61,6 +61,24 @@ PARTIAL_URL_PATTERN = re.compile(r'tiktok\.com/@[^/]*/video/\d+', re.IGNORECASE)
 FULL_URL_PATTERN = re.compile(r'tiktok\.com/@[a-zA-Z0-9_.\-]+/video/\d+', re.IGNORECASE)
 # TikTok username character class (letters, digits, underscore, period, hyphen)
 USERNAME_CHARS = r'[a-zA-Z0-9_.\-]+'
+# Full video URL: group 1 = username, group 2 = video ID
+VIDEO_URL_PATTERN = re.compile(
+    rf'https?://(?:www\.)?tiktok\.com/@({USERNAME_CHARS})/video/(\d+)'
+)
+VIDEO_ID_PATTERN = re.compile(r'/video/(\d+)')
+# HTML scans used to recover the username for partial @/video/ID URLs
+CANONICAL_LINK_PATTERN = re.compile(
+    r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+OG_URL_PATTERN = re.compile(
+    r'<meta[^>]+property=["\']og:url["\'][^>]+content=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+UNIVERSAL_DATA_PATTERN = re.compile(
+    r'<script[^>]+id=["\']__UNIVERSAL_DATA_FOR_REHYDRATION__["\'][^>]*>([^<]+)</script>'
+)
+UNIQUE_ID_PATTERN = re.compile(rf'"uniqueId"\s*:\s*"({USERNAME_CHARS})"')
 
 HTTP_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -104,7 +122,7 @@ def is_full_url(url: str) -> bool:
 
 
 def extract_video_id(url: str) -> Optional[str]:
-    m = re.search(r'/video/(\d+)', url or '')
+    m = VIDEO_ID_PATTERN.search(url or '')
     return m.group(1) if m else None
 
 
@@ -132,35 +150,15 @@ def _extract_username_from_html(html: str, video_id: str) -> Optional[str]:
     if not html or not video_id:
         return None
 
-    # 1. canonical link
-    for m in re.finditer(
-        r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']',
-        html, re.IGNORECASE,
-    ):
-        um = re.match(
-            rf'https?://(?:www\.)?tiktok\.com/@({USERNAME_CHARS})/video/{video_id}',
-            m.group(1),
-        )
-        if um:
-            return um.group(1)
-
-    # 2. og:url meta
-    for m in re.finditer(
-        r'<meta[^>]+property=["\']og:url["\'][^>]+content=["\']([^"\']+)["\']',
-        html, re.IGNORECASE,
-    ):
-        um = re.match(
-            rf'https?://(?:www\.)?tiktok\.com/@({USERNAME_CHARS})/video/{video_id}',
-            m.group(1),
-        )
-        if um:
-            return um.group(1)
+    # 1. canonical link, 2. og:url meta
+    for pattern in (CANONICAL_LINK_PATTERN, OG_URL_PATTERN):
+        for m in pattern.finditer(html):
+            um = VIDEO_URL_PATTERN.match(m.group(1))
+            if um and um.group(2) == video_id:
+                return um.group(1)
 
     # 3. UNIVERSAL_DATA JSON — same data source the Playwright crawler uses
-    m = re.search(
-        r'<script[^>]+id=["\']__UNIVERSAL_DATA_FOR_REHYDRATION__["\'][^>]*>([^<]+)</script>',
-        html,
-    )
+    m = UNIVERSAL_DATA_PATTERN.search(html)
     if m:
         try:
             j = json.loads(m.group(1))
@@ -178,17 +176,14 @@ def _extract_username_from_html(html: str, video_id: str) -> Optional[str]:
             pass
 
     # 4. direct uniqueId regex
-    m = re.search(rf'"uniqueId"\s*:\s*"({USERNAME_CHARS})"', html)
+    m = UNIQUE_ID_PATTERN.search(html)
     if m:
         return m.group(1)
 
     # 5. full @user/video/ID pattern anywhere in HTML for this specific video
-    m = re.search(
-        rf'https?://(?:www\.)?tiktok\.com/@({USERNAME_CHARS})/video/{video_id}',
-        html,
-    )
-    if m:
-        return m.group(1)
+    for m in VIDEO_URL_PATTERN.finditer(html):
+        if m.group(2) == video_id:
+            return m.group(1)
 
     return None
 
@@ -287,10 +282,7 @@ async def _pw_resolve_one(context, url: str) -> Optional[str]:
         # Last resort — scan whatever HTML loaded for any full TikTok URL
         try:
             html = await page.content()
-            m = re.search(
-                rf'https?://(?:www\.)?tiktok\.com/@{USERNAME_CHARS}/video/\d+',
-                html,
-            )
+            m = VIDEO_URL_PATTERN.search(html)
             if m:
                 return normalize_full_url(m.group(0))
         except Exception:
@@ -317,8 +309,13 @@ async def _pw_resolve_batch(urls: list) -> dict:
     browser every PW_BATCH_SIZE URLs to keep memory bounded.
     """
     from playwright.async_api import async_playwright
+    # Same route filter as the main crawler: we only read URLs and the HTML
+    from app.playwright_crawler import block_unneeded_resources
 
-    LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+    LAUNCH_ARGS = [
+        "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+        "--blink-settings=imagesEnabled=false",
+    ]
 
     results = {}
 
@@ -330,6 +327,8 @@ async def _pw_resolve_batch(urls: list) -> dict:
                 user_agent=HTTP_HEADERS["User-Agent"],
                 locale="en-US",
             )
+            # Abort images/media/fonts/CSS and trackers — "load" fires much sooner
+            await context.route("**/*", block_unneeded_resources)
             return browser, context
 
         browser, context = await _new_browser()